@@ -81,6 +81,25 @@ class ModelDataWithVelocityRepresentation(JaxsimDataclass, abc.ABC):
             ):
                 self.velocity_representation = original_representation
 
+    def with_velocity_representation(self, velocity_representation: VelRepr) -> Self:
+        """
+        Return a copy of the object with a different velocity representation.
+
+        Args:
+            velocity_representation: The new velocity representation.
+
+        Returns:
+            A new object with the new velocity representation.
+
+        Note:
+            Differently from `switch_velocity_representation`, this method does not
+            mutate the original object.
+        """
+
+        return self.replace(
+            validate=False, velocity_representation=velocity_representation
+        )
+
     @staticmethod
     @functools.partial(jax.jit, static_argnames=["other_representation", "is_force"])
     def inertial_to_other_representation(
@@ -133,7 +152,7 @@ class ModelDataWithVelocityRepresentation(JaxsimDataclass, abc.ABC):
 
             case VelRepr.Mixed:
                 W_p_O = W_H_O[0:3, 3]
-                W_H_OW = jnp.eye(4).at[0:3, 3].set(W_p_O)
+                W_H_OW = jnp.eye(4, dtype=W_H_O.dtype).at[0:3, 3].set(W_p_O)
 
                 if not is_force:
                     OW_Xv_W = jaxlie.SE3.from_matrix(W_H_OW).inverse().adjoint()
@@ -202,7 +221,7 @@ class ModelDataWithVelocityRepresentation(JaxsimDataclass, abc.ABC):
             case VelRepr.Mixed:
                 BW_array = array
                 W_p_O = W_H_O[0:3, 3]
-                W_H_OW = jnp.eye(4).at[0:3, 3].set(W_p_O)
+                W_H_OW = jnp.eye(4, dtype=W_H_O.dtype).at[0:3, 3].set(W_p_O)
 
                 if not is_force:
                     W_Xv_BW: jtp.Array = jaxlie.SE3.from_matrix(W_H_OW).adjoint()
@@ -10,9 +10,12 @@ import jaxsim.typing as jtp
 from .common import VelRepr
 
 
-@jax.jit
+@functools.partial(jax.jit, static_argnames=["contact_tile_size"])
 def collidable_point_kinematics(
-    model: js.model.JaxSimModel, data: js.data.JaxSimModelData
+    model: js.model.JaxSimModel,
+    data: js.data.JaxSimModelData,
+    *,
+    contact_tile_size: int | None = None,
 ) -> tuple[jtp.Matrix, jtp.Matrix]:
     """
     Compute the position and 3D velocity of the collidable points in the world frame.
@@ -20,6 +23,13 @@ def collidable_point_kinematics(
     Args:
         model: The model to consider.
         data: The data of the considered model.
+        contact_tile_size:
+            The optional number of collidable points processed together. If None,
+            the `contact_tile_size` of the model is used. If also the model does not
+            define it, all the collidable points are processed in parallel.
+            Otherwise, they are processed sequentially in tiles of this size. This
+            reduces the peak memory of models with many collidable points, at the
+            cost of a lower throughput.
 
     Returns:
         The position and velocity of the collidable points in the world frame.
@@ -30,19 +40,45 @@ def collidable_point_kinematics(
         the linear component of the mixed 6D frame velocity.
     """
 
+    return _collidable_point_kinematics(
+        model=model, data=data, contact_tile_size=contact_tile_size
+    )
+
+
+def _collidable_point_kinematics(
+    model: js.model.JaxSimModel,
+    data: js.data.JaxSimModelData,
+    *,
+    contact_tile_size: int | None = None,
+) -> tuple[jtp.Matrix, jtp.Matrix]:
+    """
+    Non-jitted implementation of `collidable_point_kinematics`.
+
+    Note:
+        This helper is meant to be traced inside the jitted functions of this module,
+        so that the kinematics gets fused with the downstream computations.
+        If `contact_tile_size` is None, the tile size of the model is used.
+    """
+
     from jaxsim.rbda import collidable_points
 
-    # Switch to inertial-fixed since the RBDAs expect velocities in this representation.
-    with data.switch_velocity_representation(VelRepr.Inertial):
-        W_p_Ci, W_ṗ_Ci = collidable_points.collidable_points_pos_vel(
-            model=model,
-            base_position=data.base_position(),
-            base_quaternion=data.base_orientation(dcm=False),
-            joint_positions=data.joint_positions(model=model),
-            base_linear_velocity=data.base_velocity()[0:3],
-            base_angular_velocity=data.base_velocity()[3:6],
-            joint_velocities=data.joint_velocities(model=model),
-        )
+    contact_tile_size = (
+        contact_tile_size if contact_tile_size is not None else model.contact_tile_size
+    )
+
+    # Use inertial-fixed data since the RBDAs expect velocities in this representation.
+    data = data.with_velocity_representation(VelRepr.Inertial)
+
+    W_p_Ci, W_ṗ_Ci = collidable_points.collidable_points_pos_vel(
+        model=model,
+        base_position=data.base_position(),
+        base_quaternion=data.base_orientation(dcm=False),
+        joint_positions=data.joint_positions(model=model),
+        base_linear_velocity=data.base_velocity()[0:3],
+        base_angular_velocity=data.base_velocity()[3:6],
+        joint_velocities=data.joint_velocities(model=model),
+        tile_size=contact_tile_size,
+    )
 
     return W_p_Ci, W_ṗ_Ci
 
@@ -128,36 +164,65 @@ def collidable_point_dynamics(
         The material deformation rate is always returned in the mixed frame
         `C[W] = ({}^W \mathbf{p}_C, [W])`. This is convenient for integration purpose.
         Instead, the 6D forces are returned in the active representation.
+
+    Note:
+        If the model defines a `contact_dtype`, the contact dynamics is computed
+        with this floating-point type, and the outputs are cast back to the type
+        of the model data. Similarly, if the model defines a `contact_tile_size`,
+        the kinematics of the collidable points is processed in tiles of this size.
     """
 
     # Compute the position and linear velocities (mixed representation) of
     # all collidable points belonging to the robot.
-    W_p_Ci, W_ṗ_Ci = js.contact.collidable_point_kinematics(model=model, data=data)
+    W_p_Ci, W_ṗ_Ci = _collidable_point_kinematics(model=model, data=data)
+
+    # Get the floating-point types of the model data and of the contact dynamics.
+    dtype = W_p_Ci.dtype
+    contact_dtype = model.contact_dtype if model.contact_dtype is not None else dtype
 
     # Build the soft contact model.
     soft_contacts = jaxsim.rbda.SoftContacts(
-        parameters=data.soft_contacts_params, terrain=model.terrain
+        parameters=jax.tree_util.tree_map(
+            lambda x: jnp.array(x, dtype=contact_dtype), data.soft_contacts_params
+        ),
+        terrain=model.terrain,
     )
 
-    # Compute the 6D force expressed in the inertial frame and applied to each
-    # collidable point, and the corresponding material deformation rate.
-    # Note that the material deformation rate is always returned in the mixed frame
-    # C[W] = (W_p_C, [W]). This is convenient for integration purpose.
-    W_f_Ci, CW_ṁ = jax.vmap(soft_contacts.contact_model)(
-        W_p_Ci, W_ṗ_Ci, data.state.soft_contacts.tangential_deformation
-    )
+    # Get the quantities needed to convert the 6D forces to the active representation.
+    # They are shared by all collidable points and are closed over by the vmap below.
+    W_H_B = data.base_transform().astype(contact_dtype)
+    velocity_representation = data.velocity_representation
+
+    def process_point_dynamics(
+        W_p_C: jtp.Vector, W_ṗ_C: jtp.Vector, m: jtp.Vector
+    ) -> tuple[jtp.Vector, jtp.Vector]:
 
-    # Convert the 6D forces to the active representation.
-    f_Ci = jax.vmap(
-        lambda W_f_C: data.inertial_to_other_representation(
+        # Compute the 6D force expressed in the inertial frame and applied to the
+        # collidable point, and the corresponding material deformation rate.
+        # Note that the material deformation rate is always returned in the mixed frame
+        # C[W] = (W_p_C, [W]). This is convenient for integration purpose.
+        W_f_C, CW_ṁ = soft_contacts.contact_model(W_p_C, W_ṗ_C, m)
+
+        # Convert the 6D force to the active representation.
+        f_C = data.inertial_to_other_representation(
             array=W_f_C,
-            other_representation=data.velocity_representation,
-            transform=data.base_transform(),
+            other_representation=velocity_representation,
+            transform=W_H_B,
             is_force=True,
         )
-    )(W_f_Ci)
 
-    return f_Ci, CW_ṁ
+        return f_C, CW_ṁ
+
+    # Process all the collidable points in a single pass, so that the contact model
+    # and the conversion to the active representation get fused by XLA without
+    # materializing the intermediate inertial-fixed forces.
+    f_Ci, CW_ṁ = jax.vmap(process_point_dynamics)(
+        W_p_Ci.astype(contact_dtype),
+        W_ṗ_Ci.astype(contact_dtype),
+        data.state.soft_contacts.tangential_deformation.astype(contact_dtype),
+    )
+
+    return f_Ci.astype(dtype), CW_ṁ.astype(dtype)
 
 
 @functools.partial(jax.jit, static_argnames=["link_names"])
@@ -187,23 +252,66 @@ def in_contact(
 
     W_p_Ci = collidable_point_positions(model=model, data=data)
 
-    terrain_height = jax.vmap(lambda x, y: model.terrain.height(x=x, y=y))(
-        W_p_Ci[:, 0], W_p_Ci[:, 1]
-    )
+    terrain_height = model.terrain.height_batch(x=W_p_Ci[:, 0], y=W_p_Ci[:, 1])
 
     below_terrain = W_p_Ci[:, 2] <= terrain_height
 
-    links_in_contact = jax.vmap(
-        lambda link_index: jnp.where(
-            jnp.array(model.kin_dyn_parameters.contact_parameters.body) == link_index,
-            below_terrain,
-            jnp.zeros_like(below_terrain, dtype=bool),
-        ).any()
-    )(js.link.names_to_idxs(link_names=link_names, model=model))
+    # Reduce the contact status of the collidable points to their parent links.
+    # The collidable points are sorted by parent link (see ContactParameters),
+    # therefore the reduction operates on contiguous segments.
+    # Note: segment_max returns the lowest representable value for links without
+    #       collidable points, therefore we cannot directly cast the result to bool.
+    links_in_contact_all = (
+        jax.ops.segment_max(
+            data=below_terrain.astype(jnp.int8),
+            segment_ids=jnp.array(
+                model.kin_dyn_parameters.contact_parameters.body, dtype=int
+            ),
+            num_segments=model.number_of_links(),
+            indices_are_sorted=True,
+        )
+        > 0
+    )
+
+    links_in_contact = links_in_contact_all[
+        js.link.names_to_idxs(link_names=link_names, model=model)
+    ]
 
     return links_in_contact
 
 
+@jax.jit
+def estimate_model_height(model: js.model.JaxSimModel) -> jtp.Float:
+    """
+    Estimate the height of the model in its zero configuration.
+
+    Args:
+        model: The model to consider.
+
+    Returns:
+        The estimated height of the model.
+
+    Note:
+        This function is jitted on its own so that the trace of the forward
+        kinematics needed by the estimate is reused when the jitted functions
+        calling it are re-traced. When called inside another jitted function,
+        it is still compiled as part of the caller.
+    """
+
+    zero_data = js.data.JaxSimModelData.build(
+        model=model,
+        soft_contacts_params=jaxsim.rbda.soft_contacts.SoftContactsParams(),
+    )
+
+    W_pz_CoM = js.com.com_position(model=model, data=zero_data)[2]
+
+    if model.floating_base():
+        W_pz_C = collidable_point_positions(model=model, data=zero_data)[:, -1]
+        return 2 * (W_pz_CoM - W_pz_C.min())
+
+    return 2 * W_pz_CoM
+
+
 @jax.jit
 def estimate_good_soft_contacts_parameters(
     model: js.model.JaxSimModel,
@@ -238,22 +346,6 @@ def estimate_good_soft_contacts_parameters(
         specific application.
     """
 
-    def estimate_model_height(model: js.model.JaxSimModel) -> jtp.Float:
-        """"""
-
-        zero_data = js.data.JaxSimModelData.build(
-            model=model,
-            soft_contacts_params=jaxsim.rbda.soft_contacts.SoftContactsParams(),
-        )
-
-        W_pz_CoM = js.com.com_position(model=model, data=zero_data)[2]
-
-        if model.floating_base():
-            W_pz_C = collidable_point_positions(model=model, data=zero_data)[:, -1]
-            return 2 * (W_pz_CoM - W_pz_C.min())
-
-        return 2 * W_pz_CoM
-
     max_δ = (
         max_penetration
         if max_penetration is not None
@@ -6,6 +6,7 @@ import jax.lax
 import jax.numpy as jnp
 import jax_dataclasses
 import jaxlie
+import numpy as np
 from jax_dataclasses import Static
 
 import jaxsim.typing as jtp
@@ -725,7 +726,8 @@ class ContactParameters(JaxsimDataclass):
     Attributes:
         body:
             A tuple of integers representing, for each collidable point, the index of
-            the body (link) to which it is rigidly attached to.
+            the body (link) to which it is rigidly attached to. The collidable points
+            are sorted by parent link, so that the points of each link are contiguous.
         point:
             The translation between the link frame and the collidable point, expressed
             in the coordinates of the parent link frame.
@@ -733,6 +735,14 @@ class ContactParameters(JaxsimDataclass):
     Note:
         Contrarily to LinkParameters and JointParameters, this class is not meant
         to be created with vmap. This is because the `body` attribute must be `Static`.
+
+    Note:
+        The order of the collidable points defines the order of the outputs of the
+        functions of `jaxsim.api.contact` and the layout of the tangential deformation
+        of the soft-contacts state. Since the points are sorted by parent link index,
+        it may differ from the order of the collision shapes in the model description.
+        The `body` attribute must be sorted when this object is created directly,
+        since the contact functions rely on this property.
     """
 
     body: Static[tuple[int, ...]] = dataclasses.field(default_factory=tuple)
@@ -760,6 +770,17 @@ class ContactParameters(JaxsimDataclass):
         # Get all the enabled collidable points of the model.
         collidable_points = model_description.all_enabled_collidable_points()
 
+        # Sort the collidable points by the index of their parent link, so that the
+        # points rigidly attached to the same link are stored contiguously.
+        # The sort is stable to preserve the original order within each link.
+        collidable_points = [
+            collidable_points[i]
+            for i in np.argsort(
+                [links_dict[cp.parent_link.name].index for cp in collidable_points],
+                kind="stable",
+            )
+        ]
+
         # Extract the positions L_p_C of the collidable points w.r.t. the link frames
         # they are rigidly attached to.
         points = jnp.vstack([cp.position for cp in collidable_points])
@@ -775,5 +796,6 @@ class ContactParameters(JaxsimDataclass):
 
         assert cp.point.shape[1] == 3
         assert cp.point.shape[0] == len(cp.body)
+        assert list(cp.body) == sorted(cp.body)
 
         return cp
@@ -33,6 +33,12 @@ class JaxSimModel(JaxsimDataclass):
     terrain: Static[jaxsim.terrain.Terrain] = dataclasses.field(
         default=jaxsim.terrain.FlatTerrain(), repr=False, compare=False, hash=False
     )
+    contact_dtype: Static[jax.typing.DTypeLike | None] = dataclasses.field(
+        default=None, repr=False, compare=False, hash=False
+    )
+    contact_tile_size: Static[int | None] = dataclasses.field(
+        default=None, repr=False, compare=False, hash=False
+    )
     kin_dyn_parameters: js.kin_dyn_parameters.KynDynParameters | None = (
         dataclasses.field(default=None, repr=False, compare=False, hash=False)
     )
@@ -75,6 +81,8 @@ class JaxSimModel(JaxsimDataclass):
         model_name: str | None = None,
         *,
         terrain: jaxsim.terrain.Terrain | None = None,
+        contact_dtype: jax.typing.DTypeLike | None = None,
+        contact_tile_size: int | None = None,
         is_urdf: bool | None = None,
         considered_joints: Sequence[str] | None = None,
     ) -> JaxSimModel:
@@ -90,6 +98,14 @@ class JaxSimModel(JaxsimDataclass):
                 the description.
             terrain:
                 The optional terrain to consider.
+            contact_dtype:
+                The optional floating-point type used to compute the contact
+                dynamics. If None, the default floating-point type is used.
+            contact_tile_size:
+                The optional number of collidable points whose kinematics is
+                processed together. If None, all the collidable points are processed
+                in parallel. Otherwise, they are processed sequentially in tiles of
+                this size, reducing the peak memory at the cost of a lower throughput.
             is_urdf:
                 Whether the model description is a URDF or an SDF. This is
                 automatically inferred if the model description is a path to a file.
@@ -120,6 +136,8 @@ class JaxSimModel(JaxsimDataclass):
             model_description=intermediate_description,
             model_name=model_name,
             terrain=terrain,
+            contact_dtype=contact_dtype,
+            contact_tile_size=contact_tile_size,
         )
 
         # Store the origin of the model, in case downstream logic needs it
@@ -134,6 +152,8 @@ class JaxSimModel(JaxsimDataclass):
         model_name: str | None = None,
         *,
         terrain: jaxsim.terrain.Terrain | None = None,
+        contact_dtype: jax.typing.DTypeLike | None = None,
+        contact_tile_size: int | None = None,
     ) -> JaxSimModel:
         """
         Build a Model object from an intermediate model description.
@@ -146,6 +166,14 @@ class JaxSimModel(JaxsimDataclass):
                 The optional name of the model overriding the physics model name.
             terrain:
                 The optional terrain to consider.
+            contact_dtype:
+                The optional floating-point type used to compute the contact
+                dynamics. If None, the default floating-point type is used.
+            contact_tile_size:
+                The optional number of collidable points whose kinematics is
+                processed together. If None, all the collidable points are processed
+                in parallel. Otherwise, they are processed sequentially in tiles of
+                this size, reducing the peak memory at the cost of a lower throughput.
 
         Returns:
             The built Model object.
@@ -162,6 +190,8 @@ class JaxSimModel(JaxsimDataclass):
                 model_description=model_description
             ),
             terrain=terrain or JaxSimModel.__dataclass_fields__["terrain"].default,
+            contact_dtype=contact_dtype,
+            contact_tile_size=contact_tile_size,
         )
 
         return model
@@ -340,6 +370,8 @@ def reduce(
         model_description=reduced_intermediate_description,
         model_name=model.name(),
         terrain=model.terrain,
+        contact_dtype=model.contact_dtype,
+        contact_tile_size=model.contact_tile_size,
     )
 
     # Store the origin of the model, in case downstream logic needs it
@@ -1702,12 +1734,17 @@ def link_contact_forces(
         ).sum(axis=0)
     )(jnp.arange(model.number_of_links()))
 
+    # Get the quantities needed to convert the 6D forces to the active representation.
+    # They are shared by all links and are closed over by the vmap below.
+    W_H_B = data.base_transform()
+    velocity_representation = data.velocity_representation
+
     # Convert the 6D forces to the active representation.
     f_Li = jax.vmap(
         lambda W_f_L: data.inertial_to_other_representation(
             array=W_f_L,
-            other_representation=data.velocity_representation,
-            transform=data.base_transform(),
+            other_representation=velocity_representation,
+            transform=W_H_B,
             is_force=True,
         )
     )(W_f_Li)
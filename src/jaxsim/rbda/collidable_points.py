@@ -1,3 +1,5 @@
+import functools
+
 import jax
 import jax.numpy as jnp
 import jaxlie
@@ -9,6 +11,7 @@ from jaxsim.math import Adjoint, Quaternion, Skew
 from . import utils
 
 
+@functools.partial(jax.jit, static_argnames=["tile_size"])
 def collidable_points_pos_vel(
     model: js.model.JaxSimModel,
     *,
@@ -18,6 +21,7 @@ def collidable_points_pos_vel(
     base_linear_velocity: jtp.Vector,
     base_angular_velocity: jtp.Vector,
     joint_velocities: jtp.Vector,
+    tile_size: int | None = None,
 ) -> tuple[jtp.Matrix, jtp.Matrix]:
     """
 
@@ -33,11 +37,25 @@ def collidable_points_pos_vel(
         base_angular_velocity:
             The angular velocity of the base link in inertial-fixed representation.
         joint_velocities: The velocities of the joints.
+        tile_size:
+            The optional number of collidable points processed together. If None,
+            all the collidable points are processed in parallel. Otherwise, they are
+            processed sequentially in tiles of this size, reducing the peak memory
+            at the cost of a lower throughput.
 
     Returns:
         A tuple containing the position and linear velocity of collidable points.
+
+    Note:
+        This function is jitted on its own, so that its compilation cache is keyed
+        only on the model and on the arrays of the kinematic state. The same
+        trace is then shared by all the callers computing the collidable point
+        kinematics, regardless of their velocity representation.
     """
 
+    if tile_size is not None and tile_size <= 0:
+        raise ValueError(tile_size)
+
     if len(model.kin_dyn_parameters.contact_parameters.body) == 0:
         return jnp.array(0).astype(float), jnp.empty(0).astype(float)
 
@@ -133,10 +151,37 @@ def collidable_points_pos_vel(
 
         return W_p_Ci, CW_vl_WCi
 
+    L_p_Ci = model.kin_dyn_parameters.contact_parameters.point
+    parent_link_idx_of_Ci = jnp.array(model.kin_dyn_parameters.contact_parameters.body)
+
     # Process all the collidable points in parallel
-    W_p_Ci, CW_vl_WC = jax.vmap(process_point_kinematics)(
-        model.kin_dyn_parameters.contact_parameters.point,
-        jnp.array(model.kin_dyn_parameters.contact_parameters.body),
+    if tile_size is None:
+        W_p_Ci, CW_vl_WC = jax.vmap(process_point_kinematics)(
+            L_p_Ci, parent_link_idx_of_Ci
+        )
+
+        return W_p_Ci, CW_vl_WC
+
+    # Pad the collidable points so that they can be split in tiles of equal size.
+    # The padded points are attached to the base link and are discarded at the end.
+    n_points = L_p_Ci.shape[0]
+    n_tiles = -(-n_points // tile_size)
+    n_padding = n_tiles * tile_size - n_points
+
+    L_p_Ci = jnp.pad(L_p_Ci, pad_width=((0, n_padding), (0, 0)))
+    parent_link_idx_of_Ci = jnp.pad(parent_link_idx_of_Ci, pad_width=(0, n_padding))
+
+    # Process the tiles sequentially, and the collidable points of each tile
+    # in parallel.
+    W_p_Ci, CW_vl_WC = jax.lax.map(
+        lambda tile: jax.vmap(process_point_kinematics)(*tile),
+        (
+            L_p_Ci.reshape(n_tiles, tile_size, 3),
+            parent_link_idx_of_Ci.reshape(n_tiles, tile_size),
+        ),
     )
 
-    return W_p_Ci, CW_vl_WC
+    return (
+        W_p_Ci.reshape(-1, 3)[0:n_points],
+        CW_vl_WC.reshape(-1, 3)[0:n_points],
+    )
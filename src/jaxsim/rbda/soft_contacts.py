@@ -152,6 +152,9 @@ class SoftContacts:
 
         Returns:
             A tuple containing the contact force and material deformation rate.
+
+        Note:
+            The computation is performed with the floating-point type of the inputs.
         """
 
         # Short name of parameters
@@ -175,9 +178,12 @@ class SoftContacts:
         px, py, pz = W_p_C = position.squeeze()
         vx, vy, vz = W_ṗ_C = velocity.squeeze()
 
-        # Compute the terrain normal and the contact depth
-        n̂ = self.terrain.normal(x=px, y=py).squeeze()
-        h = jnp.array([0, 0, self.terrain.height(x=px, y=py) - pz])
+        # Compute the terrain height, the terrain normal, and the contact depth.
+        # These quantities are shared by the computation of both the contact force
+        # and the material deformation rate.
+        terrain_height = self.terrain.height(x=px, y=py)
+        n̂ = self.terrain.normal(x=px, y=py).squeeze().astype(W_p_C.dtype)
+        h = jnp.array([0, 0, terrain_height - pz])
 
         # Compute the penetration depth normal to the terrain
         δ = jnp.maximum(0.0, jnp.dot(h, n̂))
@@ -190,7 +196,7 @@ class SoftContacts:
         force_normal_mag = jax.lax.select(
             pred=δ >= 1e-9,
             on_true=jnp.sqrt(δ + 1e-12) * (K * δ + D * δ̇),
-            on_false=jnp.array(0.0),
+            on_false=jnp.zeros_like(δ),
         )
 
         # Prevent negative normal forces that might occur when δ̇ is largely negative
@@ -207,8 +213,13 @@ class SoftContacts:
         # Note: this is equal to the 6D velocities transform: CW_X_W.transpose().
         W_Xf_CW = jnp.vstack(
             [
-                jnp.block([jnp.eye(3), jnp.zeros(shape=(3, 3))]),
-                jnp.block([Skew.wedge(W_p_C), jnp.eye(3)]),
+                jnp.block(
+                    [
+                        jnp.eye(3, dtype=W_p_C.dtype),
+                        jnp.zeros(shape=(3, 3), dtype=W_p_C.dtype),
+                    ]
+                ),
+                jnp.block([Skew.wedge(W_p_C), jnp.eye(3, dtype=W_p_C.dtype)]),
             ]
         )
 
@@ -235,14 +246,15 @@ class SoftContacts:
             # Check if the collidable point is below ground.
             # Note: when δ=0, we consider the point still not it contact such that
             #       we prevent divisions by 0 in the computations below.
-            active_contact = pz < self.terrain.height(x=px, y=py)
+            active_contact = pz < terrain_height
 
             def above_terrain():
-                return jnp.zeros(6), ṁ
+                return jnp.zeros(6, dtype=ṁ.dtype), ṁ
 
             def below_terrain():
-                # Decompose the velocity in normal and tangential components
-                v_normal = jnp.dot(W_ṗ_C, n̂) * n̂
+                # Decompose the velocity in normal and tangential components.
+                # Note: the normal velocity is the opposite of the penetration rate.
+                v_normal = -δ̇ * n̂
                 v_tangential = W_ṗ_C - v_normal
 
                 # Compute the tangential force. If inside the friction cone, the contact
@@ -251,7 +263,7 @@ class SoftContacts:
                 def sticking_contact():
                     # Sum the normal and tangential forces, and create the 6D force
                     CW_f_stick = force_normal + f_tangential
-                    CW_f = jnp.hstack([CW_f_stick, jnp.zeros(3)])
+                    CW_f = jnp.hstack([CW_f_stick, jnp.zeros_like(CW_f_stick)])
 
                     # In this case the 3D material deformation is the tangential velocity
                     ṁ = v_tangential
@@ -268,7 +280,7 @@ class SoftContacts:
 
                     # Sum the normal and tangential forces, and create the 6D force
                     CW_f_slip = force_normal + f_tangential_projected
-                    CW_f = jnp.hstack([CW_f_slip, jnp.zeros(3)])
+                    CW_f = jnp.hstack([CW_f_slip, jnp.zeros_like(CW_f_slip)])
 
                     # Correct the material deformation derivative for slipping contacts.
                     # Basically we compute ṁ such that we get `f_tangential` on the cone
@@ -1,5 +1,6 @@
 import abc
 
+import jax
 import jax.numpy as jnp
 import jax_dataclasses
 
@@ -13,6 +14,25 @@ class Terrain(abc.ABC):
     def height(self, x: float, y: float) -> float:
         pass
 
+    def height_batch(self, x: jtp.Vector, y: jtp.Vector) -> jtp.Vector:
+        """
+        Compute the height of the terrain at multiple (x, y) locations.
+
+        Args:
+            x (jtp.Vector): The x-coordinates of the locations.
+            y (jtp.Vector): The y-coordinates of the locations.
+
+        Returns:
+            jtp.Vector: The height of the terrain at the specified locations.
+
+        Note:
+            The default implementation vectorizes `height` over the locations.
+            Terrains whose height can be computed with broadcasting should override
+            this method to operate directly on the input arrays.
+        """
+
+        return jax.vmap(lambda x, y: jnp.array(self.height(x=x, y=y)))(x, y)
+
     def normal(self, x: float, y: float) -> jtp.Vector:
         """
         Compute the normal vector of the terrain at a specific (x, y) location.
@@ -43,6 +63,12 @@ class FlatTerrain(Terrain):
     def height(self, x: float, y: float) -> float:
         return 0.0
 
+    def height_batch(self, x: jtp.Vector, y: jtp.Vector) -> jtp.Vector:
+        x = jnp.asarray(x)
+        return jnp.broadcast_to(
+            jnp.asarray(self.height(x=0.0, y=0.0), dtype=x.dtype), x.shape
+        )
+
 
 @jax_dataclasses.pytree_dataclass
 class PlaneTerrain(Terrain):
@@ -76,3 +102,17 @@ class PlaneTerrain(Terrain):
 
         a, b, c = self.plane_normal
         return -(a * x + b * y) / c
+
+    def height_batch(self, x: jtp.Vector, y: jtp.Vector) -> jtp.Vector:
+        """
+        Compute the height of the terrain at multiple (x, y) locations on a plane.
+
+        Args:
+            x (jtp.Vector): The x-coordinates of the locations.
+            y (jtp.Vector): The y-coordinates of the locations.
+
+        Returns:
+            jtp.Vector: The height of the terrain at the specified locations.
+        """
+
+        return self.height(x=jnp.asarray(x), y=jnp.asarray(y))
@@ -91,6 +91,34 @@ def test_data_switch_velocity_representation(
     )
 
 
+def test_data_with_velocity_representation(
+    jaxsim_models_types: js.model.JaxSimModel,
+    prng_key: jax.Array,
+):
+
+    model = jaxsim_models_types
+
+    _, subkey = jax.random.split(prng_key, num=2)
+    data = js.data.random_model_data(
+        model=model, key=subkey, velocity_representation=VelRepr.Inertial
+    )
+
+    # =====
+    # Tests
+    # =====
+
+    for velocity_representation in VelRepr:
+
+        new_data = data.with_velocity_representation(velocity_representation)
+
+        # The original object should not be modified.
+        assert data.velocity_representation is VelRepr.Inertial
+        assert new_data.velocity_representation is velocity_representation
+
+        with data.switch_velocity_representation(velocity_representation):
+            assert new_data.base_velocity() == pytest.approx(data.base_velocity())
+
+
 def test_data_change_velocity_representation(
     jaxsim_models_types: js.model.JaxSimModel,
     prng_key: jax.Array,
@@ -1,4 +1,6 @@
 import jax
+import jax.numpy as jnp
+import numpy as np
 import pytest
 
 import jaxsim.api as js
@@ -35,3 +37,144 @@ def test_collidable_point_jacobians(
     v_WC_from_jax = jax.vmap(lambda J, ν: J @ ν, in_axes=(0, None))(CW_J_WC, ν)
 
     assert W_ṗ_C == pytest.approx(v_WC_from_jax[:, 0:3])
+
+
+def test_in_contact(
+    jaxsim_models_types: js.model.JaxSimModel,
+    prng_key: jax.Array,
+):
+
+    model = jaxsim_models_types
+
+    _, subkey = jax.random.split(prng_key, num=2)
+    # Sample the base position close to the terrain to get some active contacts.
+    data = js.data.random_model_data(
+        model=model, key=subkey, base_pos_bounds=((-1, -1, -0.1), (1, 1, 0.1))
+    )
+
+    # =====
+    # Tests
+    # =====
+
+    W_p_C = js.contact.collidable_point_positions(model=model, data=data)
+
+    # Compute the expected contact status of each link from the collidable points.
+    # Note: all the models used in the tests are simulated over a flat terrain.
+    parent_link_idxs = np.array(model.kin_dyn_parameters.contact_parameters.body)
+    expected = np.array(
+        [
+            np.any(np.array(W_p_C)[parent_link_idxs == link_idx, 2] <= 0.0)
+            for link_idx in range(model.number_of_links())
+        ]
+    )
+
+    assert np.array_equal(js.contact.in_contact(model=model, data=data), expected)
+
+    # Check that the subset of links is returned in the requested order.
+    link_names = tuple(reversed(model.link_names()))
+    link_idxs = js.link.names_to_idxs(model=model, link_names=link_names)
+
+    assert np.array_equal(
+        js.contact.in_contact(model=model, data=data, link_names=link_names),
+        expected[np.array(link_idxs)],
+    )
+
+
+def test_collidable_point_dynamics_contact_dtype(
+    jaxsim_models_types: js.model.JaxSimModel,
+    velocity_representation: VelRepr,
+    prng_key: jax.Array,
+):
+
+    model = jaxsim_models_types
+
+    # Build a model computing the contact dynamics in single precision.
+    model_f32 = model.replace(validate=False, contact_dtype=jnp.float32)
+
+    _, subkey = jax.random.split(prng_key, num=2)
+    data = js.data.random_model_data(
+        model=model,
+        key=subkey,
+        velocity_representation=velocity_representation,
+        base_pos_bounds=((-1, -1, -0.1), (1, 1, 0.1)),
+    )
+
+    # =====
+    # Tests
+    # =====
+
+    f_C, ṁ = js.contact.collidable_point_dynamics(model=model, data=data)
+    f_C_f32, ṁ_f32 = js.contact.collidable_point_dynamics(model=model_f32, data=data)
+
+    # The outputs are cast back to the floating-point type of the data.
+    assert f_C_f32.dtype == f_C.dtype
+    assert ṁ_f32.dtype == ṁ.dtype
+
+    assert f_C_f32 == pytest.approx(f_C, rel=1e-4, abs=1e-3)
+    assert ṁ_f32 == pytest.approx(ṁ, rel=1e-4, abs=1e-6)
+
+    # Check that the reduced model maintains the contact dtype of the full model.
+    model_f32_reduced = js.model.reduce(
+        model=model_f32, considered_joints=model_f32.joint_names()
+    )
+
+    assert model_f32_reduced.contact_dtype == model_f32.contact_dtype
+
+
+@pytest.mark.parametrize("contact_tile_size", [1, 3, 1000])
+def test_collidable_point_kinematics_tiled(
+    jaxsim_models_types: js.model.JaxSimModel,
+    contact_tile_size: int,
+    prng_key: jax.Array,
+):
+
+    model = jaxsim_models_types
+
+    _, subkey = jax.random.split(prng_key, num=2)
+    data = js.data.random_model_data(model=model, key=subkey)
+
+    # =====
+    # Tests
+    # =====
+
+    W_p_C, W_ṗ_C = js.contact.collidable_point_kinematics(model=model, data=data)
+
+    W_p_C_tiled, W_ṗ_C_tiled = js.contact.collidable_point_kinematics(
+        model=model, data=data, contact_tile_size=contact_tile_size
+    )
+
+    assert W_p_C_tiled.shape == W_p_C.shape
+    assert W_p_C_tiled == pytest.approx(W_p_C)
+    assert W_ṗ_C_tiled == pytest.approx(W_ṗ_C)
+
+    # Check that the tile size of the model is used by all the contact functions.
+    model_tiled = model.replace(validate=False, contact_tile_size=contact_tile_size)
+
+    # The tiles are processed with an additional scan over the collidable points.
+    def count_scans(model: js.model.JaxSimModel) -> int:
+        jaxpr = jax.make_jaxpr(
+            lambda data: js.contact.collidable_point_dynamics(model=model, data=data)
+        )(data)
+        return str(jaxpr).count(" scan[")
+
+    assert count_scans(model=model_tiled) == count_scans(model=model) + 1
+
+    f_C, ṁ = js.contact.collidable_point_dynamics(model=model, data=data)
+    f_C_tiled, ṁ_tiled = js.contact.collidable_point_dynamics(
+        model=model_tiled, data=data
+    )
+
+    assert f_C_tiled == pytest.approx(f_C)
+    assert ṁ_tiled == pytest.approx(ṁ)
+
+    assert np.array_equal(
+        js.contact.in_contact(model=model_tiled, data=data),
+        js.contact.in_contact(model=model, data=data),
+    )
+
+    # Check that the reduced model maintains the tile size of the full model.
+    model_tiled_reduced = js.model.reduce(
+        model=model_tiled, considered_joints=model_tiled.joint_names()
+    )
+
+    assert model_tiled_reduced.contact_tile_size == contact_tile_size
@@ -0,0 +1,48 @@
+import jax
+import jax.numpy as jnp
+import jax_dataclasses
+import pytest
+
+import jaxsim.terrain
+
+
+@jax_dataclasses.pytree_dataclass
+class SinusoidalTerrain(jaxsim.terrain.Terrain):
+    def height(self, x: float, y: float) -> float:
+        return 0.1 * jnp.sin(x) * jnp.cos(y)
+
+
+@jax_dataclasses.pytree_dataclass
+class RaisedFlatTerrain(jaxsim.terrain.FlatTerrain):
+    def height(self, x: float, y: float) -> float:
+        return 0.5
+
+
+@pytest.mark.parametrize(
+    "terrain",
+    [
+        jaxsim.terrain.FlatTerrain(),
+        jaxsim.terrain.PlaneTerrain.build(plane_normal=[0.1, -0.2, 1.0]),
+        SinusoidalTerrain(),
+        RaisedFlatTerrain(),
+    ],
+    ids=["flat", "plane", "custom", "flat_subclass"],
+)
+def test_terrain_height_batch(terrain: jaxsim.terrain.Terrain, prng_key: jax.Array):
+
+    _, subkey = jax.random.split(prng_key, num=2)
+    x, y = jax.random.uniform(subkey, shape=(2, 10), minval=-1.0, maxval=1.0)
+
+    # =====
+    # Tests
+    # =====
+
+    h = jax.vmap(lambda x, y: jnp.array(terrain.height(x=x, y=y), dtype=float))(x, y)
+    h_batch = terrain.height_batch(x=x, y=y)
+
+    assert h_batch.shape == x.shape
+    assert h_batch == pytest.approx(h)
+
+    # The heights should follow the floating-point type of the inputs.
+    x_f32, y_f32 = x.astype(jnp.float32), y.astype(jnp.float32)
+    assert terrain.height_batch(x=x_f32, y=y_f32).dtype == jnp.float32